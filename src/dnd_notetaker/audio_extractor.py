@@ -1,5 +1,6 @@
 """Simplified audio extraction from video files"""
 
+import shlex
 import subprocess
 import logging
 from pathlib import Path
@@ -21,30 +22,19 @@ class AudioExtractor:
             video_path: Path to input video file
             output_path: Path to output audio file (mp3)
         """
+        cmd = self._build_command(video_path, output_path)
+        
         if self.config and self.config.dry_run:
             # Dry run mode - just show what would happen
             print(f"[DRY RUN] Would extract audio using FFmpeg:")
             print(f"  Input: {video_path}")
             print(f"  Output: {output_path}")
-            print(f"  Command: ffmpeg -i {video_path} -vn -acodec libmp3lame -b:a 128k -ar 44100 -ac 1 {output_path}")
+            print(f"  Command: {shlex.join(cmd)}")
             return
             
         # Ensure output directory exists
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # FFmpeg command for audio extraction with optimization
-        cmd = [
-            'ffmpeg',
-            '-i', str(video_path),
-            '-vn',  # No video
-            '-acodec', 'libmp3lame',
-            '-b:a', '128k',  # Audio bitrate
-            '-ar', '44100',  # Sample rate
-            '-ac', '1',  # Mono audio (smaller file)
-            '-y',  # Overwrite output
-            str(output_path)
-        ]
-        
         try:
             # Run FFmpeg with progress suppression
             result = subprocess.run(
@@ -67,4 +57,22 @@ class AudioExtractor:
             logger.error(error_msg)
             raise RuntimeError(error_msg)
         except FileNotFoundError:
-            raise RuntimeError("FFmpeg not found. Please install FFmpeg: https://ffmpeg.org/download.html")
\ No newline at end of file
+            raise RuntimeError("FFmpeg not found. Please install FFmpeg: https://ffmpeg.org/download.html")
+    
+    def _build_command(self, video_path: Path, output_path: Path) -> list:
+        """Build the FFmpeg argv for audio extraction
+        
+        The same list is used for execution and for the dry-run preview, so
+        the printed command always matches what would actually run.
+        """
+        return [
+            'ffmpeg',
+            '-i', str(video_path),
+            '-vn',  # No video
+            '-acodec', 'libmp3lame',
+            '-b:a', '128k',  # Audio bitrate
+            '-ar', '44100',  # Sample rate
+            '-ac', '1',  # Mono audio (smaller file)
+            '-y',  # Overwrite output
+            str(output_path)
+        ]
@@ -1,20 +1,49 @@
 import argparse
+import functools
 import os
 import shutil
+import stat
 import subprocess
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 
-from moviepy import VideoFileClip
 from tqdm import tqdm
 
 from .utils import setup_logging
 
 
+@functools.lru_cache(maxsize=256)
+def _probe_duration(audio_path, mtime_ns, size):
+    """Run ffprobe for the duration of one version of a file
+
+    mtime_ns and size are part of the cache key only, so a modified file is
+    probed again instead of returning a stale duration. Failures raise rather
+    than return, so lru_cache never stores them and the next call re-probes.
+    """
+    cmd = [
+        "ffprobe",
+        "-v",
+        "error",
+        "-show_entries",
+        "format=duration",
+        "-of",
+        "default=noprint_wrappers=1:nokey=1",
+        audio_path,
+    ]
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"ffprobe failed: {result.stderr}")
+    return float(result.stdout.strip())
+
+
 class AudioProcessor:
     def __init__(self):
         self.logger = setup_logging("AudioProcessor")
         self.MAX_CHUNK_SIZE = 24 * 1024 * 1024  # 24MB to be safe
         self.temp_dirs = []  # Track temporary directories for cleanup
+        self.max_split_workers = os.cpu_count() or 1  # Concurrent ffmpeg chunk jobs
+        # Bitrate for re-encoded chunks; a 15 minute chunk at 128k is ~14MB
+        self.CHUNK_BITRATE = 128 * 1000
 
     def cleanup(self):
         """Clean up any temporary directories created"""
@@ -36,16 +65,24 @@ class AudioProcessor:
         return temp_dir
 
     def verify_audio_file(self, audio_path):
-        """Verify audio file exists and is accessible"""
-        if not os.path.exists(audio_path):
-            raise FileNotFoundError(f"Audio file not found: {audio_path}")
+        """Verify audio file exists and is accessible
+
+        Returns the file's stat result so callers can reuse it instead of
+        stat-ing the same path again.
+        """
+        try:
+            stat_result = os.stat(audio_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Audio file not found: {audio_path}") from None
 
-        if not os.path.isfile(audio_path):
+        if not stat.S_ISREG(stat_result.st_mode):
             raise ValueError(f"Path is not a file: {audio_path}")
 
         if not os.access(audio_path, os.R_OK):
             raise PermissionError(f"No permission to read file: {audio_path}")
 
+        return stat_result
+
     def extract_audio(self, video_path, output_dir):
         """Extract audio from video file"""
         self.logger.info(f"Extracting audio from video: {video_path}")
@@ -57,59 +94,73 @@ class AudioProcessor:
         # Create output directory
         os.makedirs(output_dir, exist_ok=True)
 
-        # Extract audio with progress bar
-        video = VideoFileClip(video_path)
-        duration = video.duration
-        
-        if video.audio is None:
-            raise ValueError(f"Video file has no audio track: {video_path}")
-
-        with tqdm(total=100, desc="Extracting audio") as pbar:
-
-            def progress_callback(t):
-                pbar.update(int(t * 100) - pbar.n)
+        # Extract audio with ffmpeg directly; -vn skips decoding video frames
+        audio_path = os.path.join(output_dir, "session_audio.mp3")
+        cmd = [
+            "ffmpeg",
+            "-i",
+            video_path,
+            "-vn",  # No video
+            "-acodec",
+            "libmp3lame",
+            "-q:a",
+            "4",
+            "-y",  # Overwrite output files
+            audio_path,
+        ]
 
-            audio_path = os.path.join(output_dir, "session_audio.mp3")
-            video.audio.write_audiofile(
-                audio_path, logger=None
-            )  # Disable moviepy's logging
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        if result.returncode != 0:
+            raise Exception(f"ffmpeg failed: {result.stderr}")
 
-        video.close()
         self.logger.info(f"Successfully extracted audio to: {audio_path}")
         return audio_path
 
-    def get_audio_duration(self, audio_path):
-        """Get audio duration in seconds using ffprobe"""
-        cmd = [
-            "ffprobe",
-            "-v",
-            "error",
-            "-show_entries",
-            "format=duration",
-            "-of",
-            "default=noprint_wrappers=1:nokey=1",
-            audio_path,
-        ]
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        if result.returncode == 0:
-            return float(result.stdout.strip())
-        return None
+    def get_audio_duration(self, audio_path, stat_result=None):
+        """Get audio duration in seconds using ffprobe
+
+        Results are cached per (path, mtime, size), so probing an unchanged
+        file again does not spawn another ffprobe process. Returns None if the
+        file can't be stat-ed or ffprobe fails; failed probes are not cached.
+        """
+        try:
+            if stat_result is None:
+                stat_result = os.stat(audio_path)
+            return _probe_duration(
+                str(audio_path), stat_result.st_mtime_ns, stat_result.st_size
+            )
+        except (OSError, RuntimeError, ValueError) as e:
+            self.logger.warning(f"Could not probe audio duration: {e}")
+            return None
 
     def split_audio_with_ffmpeg(
-        self, audio_path, output_dir, start_seconds, duration_seconds, chunk_num
+        self,
+        audio_path,
+        output_dir,
+        start_seconds,
+        duration_seconds,
+        chunk_num,
+        stream_copy=False,
     ):
-        """Split audio using ffmpeg directly without loading into memory"""
+        """Split audio using ffmpeg directly without loading into memory
+
+        With stream_copy, MP3 input is copied into the chunk instead of being
+        re-encoded; otherwise the chunk is encoded at CHUNK_BITRATE.
+        """
         chunk_path = os.path.join(output_dir, f"chunk_{chunk_num}.mp3")
+        if stream_copy and str(audio_path).lower().endswith(".mp3"):
+            codec_args = ["-acodec", "copy"]
+        else:
+            codec_args = ["-acodec", "mp3", "-b:a", str(self.CHUNK_BITRATE)]
         cmd = [
             "ffmpeg",
-            "-i",
-            audio_path,
             "-ss",
             str(start_seconds),
+            "-i",
+            audio_path,
             "-t",
             str(duration_seconds),
-            "-acodec",
-            "mp3",
+            *codec_args,
             "-y",  # Overwrite output files
             chunk_path,
         ]
@@ -129,32 +180,24 @@ class AudioProcessor:
         temp_dir = None
 
         try:
-            # Verify input file
-            self.verify_audio_file(audio_path)
-
-            # Try to get file size first
-            file_size = 0  # Default value
-            try:
-                file_size = os.path.getsize(audio_path)
-                self.logger.debug(f"Audio file size: {file_size/1024/1024:.1f}MB")
-
-                # If file is small enough, return as is
-                if file_size <= self.MAX_CHUNK_SIZE:
-                    self.logger.info(
-                        "Audio file is within size limit, no splitting needed"
-                    )
-                    return [audio_path]
-            except Exception as e:
-                self.logger.warning(
-                    f"Could not determine file size, will attempt to split: {str(e)}"
-                )
+            # Verify input file; its stat result is reused below
+            stat_result = self.verify_audio_file(audio_path)
+
+            file_size = stat_result.st_size
+            self.logger.debug(f"Audio file size: {file_size/1024/1024:.1f}MB")
+
+            # If file is small enough, return as is
+            if file_size <= self.MAX_CHUNK_SIZE:
+                self.logger.info("Audio file is within size limit, no splitting needed")
+                return [audio_path]
 
             # Create temporary directory for chunks in the output directory
             temp_dir = self.create_temp_dir(output_dir)
 
             # Get duration using ffprobe (doesn't load file into memory)
-            duration_seconds = self.get_audio_duration(audio_path)
-            if duration_seconds is None:
+            duration_seconds = self.get_audio_duration(audio_path, stat_result)
+            duration_estimated = duration_seconds is None
+            if duration_estimated:
                 self.logger.warning(
                     "Could not determine duration, attempting to split by file size estimate"
                 )
@@ -179,22 +222,41 @@ class AudioProcessor:
                 self.logger.info("Audio duration suggests no splitting needed")
                 return [audio_path]
 
+            # Copying keeps the source bitrate, so only do it when a full chunk
+            # at that rate fits under MAX_CHUNK_SIZE with a 5% margin. An
+            # estimated duration says nothing about the real bitrate, so
+            # re-encode in that case
+            copied_chunk_size = file_size / duration_seconds * chunk_duration_seconds
+            stream_copy = (
+                not duration_estimated
+                and copied_chunk_size <= self.MAX_CHUNK_SIZE * 0.95
+            )
+
             self.logger.info(f"Splitting into {num_chunks} chunks (~15 minutes each)")
             chunk_paths = []
-
-            # Split using ffmpeg (memory efficient)
-            with tqdm(total=num_chunks, desc="Splitting audio") as pbar:
-                for i in range(num_chunks):
-                    start_time = i * chunk_duration_seconds
-                    # Make sure we don't exceed the actual duration
-                    chunk_duration = min(
-                        chunk_duration_seconds, duration_seconds - start_time
-                    )
-
-                    chunk_path = self.split_audio_with_ffmpeg(
-                        audio_path, temp_dir, start_time, chunk_duration, i + 1
-                    )
-
+            start_times = [i * chunk_duration_seconds for i in range(num_chunks)]
+            # Make sure we don't exceed the actual duration
+            chunk_durations = [
+                min(chunk_duration_seconds, duration_seconds - start_time)
+                for start_time in start_times
+            ]
+
+            # Split using ffmpeg (memory efficient). Each chunk is its own
+            # ffmpeg process, so they run side by side; map() keeps them in order
+            workers = max(1, min(self.max_split_workers, num_chunks))
+            with ThreadPoolExecutor(max_workers=workers) as executor, tqdm(
+                total=num_chunks, desc="Splitting audio"
+            ) as pbar:
+                results = executor.map(
+                    self.split_audio_with_ffmpeg,
+                    [audio_path] * num_chunks,
+                    [temp_dir] * num_chunks,
+                    start_times,
+                    chunk_durations,
+                    range(1, num_chunks + 1),
+                    [stream_copy] * num_chunks,
+                )
+                for i, chunk_path in enumerate(results):
                     # Verify chunk was created and check size
                     if os.path.exists(chunk_path):
                         chunk_size = os.path.getsize(chunk_path)
@@ -13,6 +13,8 @@ class Config:
     
     def __init__(self, config_path: Optional[str] = None, dry_run: bool = False):
         self.dry_run = dry_run
+        # Directories already created by output_dir, so repeat reads skip mkdir
+        self._created_dirs = set()
         
         # Support environment variable for config location (useful for Docker)
         if config_path:
@@ -82,6 +84,15 @@ class Config:
             )
         return path
     
+    @property
+    def note_generation_workers(self) -> int:
+        """Get how many transcript chunks may be summarized at once
+
+        Each chunk request can approach 200k tokens, so the default of 1 keeps
+        requests sequential and within ordinary tokens-per-minute limits.
+        """
+        return max(1, int(self._config.get("note_generation_workers", 1)))
+    
     @property
     def output_dir(self) -> Path:
         """Get output directory"""
@@ -93,8 +104,9 @@ class Config:
             path = Path(env_output)
         else:
             path = Path(self._config.get("output_dir", "./meet_notes_output")).expanduser()
-        if not self.dry_run:
+        if not self.dry_run and path not in self._created_dirs:
             path.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(path)
         return path
     
     @output_dir.setter
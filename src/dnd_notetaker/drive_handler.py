@@ -58,8 +58,12 @@ class DriveHandler:
             if not self.drive_service:
                 self.setup_drive_service()
                 
-            # Query for all video files in the folder
-            query = f"'{folder_id}' in parents and mimeType contains 'video/'"
+            # Query for all video files in the folder, letting Drive drop
+            # trashed files instead of sending them back to us
+            query = (
+                f"'{folder_id}' in parents and mimeType contains 'video/' "
+                "and trashed = false"
+            )
             
             if not self.drive_service:
                 raise RuntimeError("Drive service not initialized")
@@ -76,6 +80,7 @@ class DriveHandler:
                 recordings.append({
                     "index": idx + 1,
                     "file_name": file.get("name", "Unknown"),
+                    "file_size": int(file.get("size", 0)),
                     "file_size_mb": int(file.get("size", 0)) / (1024 * 1024),
                     "file_id": file.get("id"),
                     "mime_type": file.get("mimeType", ""),
@@ -90,8 +95,12 @@ class DriveHandler:
             LOGGER.error(f"Error listing Drive folder recordings: {str(e)}")
             raise
 
-    def download_file(self, file_id, download_dir):
-        """Download a file from Google Drive by its ID"""
+    def download_file(self, file_id, download_dir, file_metadata=None):
+        """Download a file from Google Drive by its ID
+
+        file_metadata (name, size, mimeType) already fetched for this file,
+        e.g. from a listing, skips the metadata request.
+        """
         if not self.drive_service:
             self.setup_drive_service()
 
@@ -99,12 +108,13 @@ class DriveHandler:
             if not self.drive_service:
                 raise RuntimeError("Drive service not initialized")
                 
-            # Get file metadata with additional fields
-            file_metadata = (
-                self.drive_service.files()
-                .get(fileId=file_id, fields="name,size,mimeType")
-                .execute()
-            )
+            # Get file metadata with additional fields unless the caller has it
+            if file_metadata is None:
+                file_metadata = (
+                    self.drive_service.files()
+                    .get(fileId=file_id, fields="name,size,mimeType")
+                    .execute()
+                )
             original_name = file_metadata["name"]
             mime_type = file_metadata.get("mimeType", "")
             file_size = int(file_metadata.get("size", 0))
@@ -197,20 +207,23 @@ class DriveHandler:
         # Look for video files that might be meeting recordings
         video_extensions = [".mp4", ".webm", ".mov", ".avi", ".mkv"]
 
-        for filename in os.listdir(download_dir):
-            # Check if it's a video file
-            if any(filename.lower().endswith(ext) for ext in video_extensions):
-                # Check if filename contains relevant keywords
-                if any(
-                    keyword in filename
-                    for keyword in ["DnD", "D&D", "Recording", name_filter]
-                ):
-                    filepath = os.path.join(download_dir, filename)
-                    file_size = os.path.getsize(filepath)
-                    LOGGER.info(
-                        f"Found existing file: {filename} ({file_size / (1024*1024):.2f} MB)"
-                    )
-                    return filepath
+        # scandir hands back entries with cached type info, so only the
+        # matching file costs a stat
+        with os.scandir(download_dir) as entries:
+            for entry in entries:
+                filename = entry.name
+                # Check if it's a video file
+                if any(filename.lower().endswith(ext) for ext in video_extensions):
+                    # Check if filename contains relevant keywords
+                    if any(
+                        keyword in filename
+                        for keyword in ["DnD", "D&D", "Recording", name_filter]
+                    ) and entry.is_file():
+                        file_size = entry.stat().st_size
+                        LOGGER.info(
+                            f"Found existing file: {filename} ({file_size / (1024*1024):.2f} MB)"
+                        )
+                        return entry.path
         return None
 
     def find_recording_by_name(self, name_filter, folder_id=None):
@@ -245,8 +258,15 @@ class DriveHandler:
             if not recording:
                 raise Exception(f"No recording found matching: {name_filter}")
                 
-            # Download the file
-            return self.download_file(recording["file_id"], download_dir)
+            # Download the file, reusing the metadata the listing returned
+            file_metadata = {
+                "name": recording["file_name"],
+                "size": recording["file_size"],
+                "mimeType": recording["mime_type"],
+            }
+            return self.download_file(
+                recording["file_id"], download_dir, file_metadata
+            )
 
         except Exception as e:
             LOGGER.error(f"Error in download_recording: {str(e)}")
@@ -2,6 +2,7 @@
 
 import logging
 import openai
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 import textwrap
 
@@ -19,6 +20,8 @@ class NoteGenerator:
             self.client = None
         self.model = "o4-mini"
         self.max_tokens = max_tokens  # Max tokens for OpenAI models
+        # Concurrent chunk summary requests; opt-in via config for higher rate limits
+        self.max_workers = config.note_generation_workers if config else 1
         
     def generate(self, transcript: str) -> str:
         """Generate prose-style notes from transcript
@@ -44,14 +47,15 @@ class NoteGenerator:
             # Process single chunk
             return self._generate_notes(chunks[0])
         else:
-            # Process multiple chunks and combine
-            logger.info(f"Processing {len(chunks)} transcript chunks...")
-            chunk_summaries = []
-            
-            for i, chunk in enumerate(chunks):
-                logger.info(f"Processing chunk {i+1}/{len(chunks)}...")
-                summary = self._generate_chunk_summary(chunk, i+1, len(chunks))
-                chunk_summaries.append(summary)
+            # Process multiple chunks concurrently and combine
+            # Each summary is an independent API call, so they can overlap;
+            # map() keeps the summaries in chronological order
+            total = len(chunks)
+            logger.info(f"Processing {total} transcript chunks...")
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, total)) as executor:
+                chunk_summaries = list(executor.map(
+                    self._generate_chunk_summary, chunks, range(1, total + 1), [total] * total
+                ))
             
             # Combine summaries into final notes
             return self._combine_summaries(chunk_summaries)
@@ -115,6 +119,7 @@ Write the summary as a cohesive narrative that captures the essence of the meeti
     
     def _generate_chunk_summary(self, chunk: str, chunk_num: int, total_chunks: int) -> str:
         """Generate summary for a transcript chunk"""
+        logger.info(f"Processing chunk {chunk_num}/{total_chunks}...")
         prompt = f"""You are summarizing part {chunk_num} of {total_chunks} of a meeting transcript.
 Write a flowing narrative summary of this portion of the meeting.
 
@@ -26,12 +26,15 @@ class SimplifiedDriveHandler:
         else:
             self.service = None
     
-    def download_file(self, file_id: str, output_dir: Path) -> Path:
+    def download_file(self, file_id: str, output_dir: Path,
+                      file_metadata: Optional[dict] = None) -> Path:
         """Download a specific file by ID
         
         Args:
             file_id: Google Drive file ID
             output_dir: Directory to save the file
+            file_metadata: Metadata already fetched for this file (name, size,
+                mimeType), e.g. from a listing. Skips the metadata request.
             
         Returns:
             Path to downloaded file
@@ -48,17 +51,19 @@ class SimplifiedDriveHandler:
             if not self.service:
                 raise RuntimeError("Drive service not initialized (check dry_run mode)")
                 
-            # Get file metadata
-            file_metadata = self.service.files().get(
-                fileId=file_id,
-                fields='name,size,mimeType'
-            ).execute()
+            # Get file metadata unless the caller already has it
+            metadata = file_metadata
+            if metadata is None:
+                metadata = self.service.files().get(
+                    fileId=file_id,
+                    fields='name,size,mimeType'
+                ).execute()
             
-            filename = file_metadata['name']
-            file_size = int(file_metadata.get('size', 0))
+            filename = metadata['name']
+            file_size = int(metadata.get('size', 0))
             
             # Ensure it's a video file
-            mime_type = file_metadata.get('mimeType', '')
+            mime_type = metadata.get('mimeType', '')
             if not mime_type.startswith('video/'):
                 raise ValueError(f"File is not a video: {mime_type}")
             
@@ -142,8 +147,8 @@ class SimplifiedDriveHandler:
             logger.info(f"Found recording: {video_file['name']}")
             logger.info(f"Modified: {video_file['modifiedTime']}")
             
-            # Download the file
-            return self.download_file(video_file['id'], output_dir)
+            # Download the file, reusing the metadata from the listing
+            return self.download_file(video_file['id'], output_dir, video_file)
             
         except Exception as e:
             logger.error(f"Failed to find recent recording: {e}")
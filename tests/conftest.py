@@ -1,18 +1,29 @@
 """Shared test fixtures and configuration for pytest"""
 
 import os
-import shutil
-import tempfile
 
 import pytest
 
 
+@pytest.fixture(autouse=True)
+def isolated_cwd(tmp_path, monkeypatch):
+    """Run each test from its own tmp_path
+
+    Config and DocsUploader fall back to a cwd-relative .credentials/, so
+    without this tests write into the checkout and can collide when run in
+    parallel workers.
+    """
+    monkeypatch.chdir(tmp_path)
+
+
 @pytest.fixture
-def temp_dir():
-    """Create a temporary directory for test files"""
-    temp_dir = tempfile.mkdtemp()
-    yield temp_dir
-    shutil.rmtree(temp_dir, ignore_errors=True)
+def temp_dir(tmp_path):
+    """Create a temporary directory for test files
+
+    Backed by pytest's per-session base directory, which pytest prunes
+    itself, so tests don't pay for an rmtree each.
+    """
+    return str(tmp_path)
 
 
 @pytest.fixture
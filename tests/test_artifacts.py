@@ -4,8 +4,7 @@ import pytest
 import json
 import tempfile
 from pathlib import Path
-from unittest.mock import patch, Mock
-from datetime import datetime
+from unittest.mock import Mock
 
 from dnd_notetaker.artifacts import Artifacts
 
@@ -92,25 +91,22 @@ class TestArtifacts:
         assert audio_meta['size'] == '13.0 B'  # "audio content"
         assert audio_meta['path'] == 'audio.mp3'
     
-    def test_get_file_size_formatting(self, artifacts):
+    @pytest.mark.parametrize("size_bytes,expected", [
+        (100, "100.0 B"),
+        (1024, "1.0 KB"),
+        (1024 * 1024, "1.0 MB"),
+        (1024 * 1024 * 1024, "1.0 GB"),
+        (1536, "1.5 KB"),
+        (1024 * 1024 * 1.5, "1.5 MB"),
+    ])
+    def test_get_file_size_formatting(self, artifacts, size_bytes, expected):
         """Test file size formatting"""
-        # Create files of different sizes
-        test_cases = [
-            (100, "100.0 B"),
-            (1024, "1.0 KB"),
-            (1024 * 1024, "1.0 MB"),
-            (1024 * 1024 * 1024, "1.0 GB"),
-            (1536, "1.5 KB"),
-            (1024 * 1024 * 1.5, "1.5 MB"),
-        ]
-        
-        for size_bytes, expected in test_cases:
-            # Create a mock path with specific size
-            mock_path = Mock()
-            mock_path.stat.return_value.st_size = size_bytes
-            
-            result = artifacts._get_file_size(mock_path)
-            assert result == expected
+        # Create a mock path with specific size
+        mock_path = Mock()
+        mock_path.stat.return_value.st_size = size_bytes
+        
+        result = artifacts._get_file_size(mock_path)
+        assert result == expected
     
     def test_html_viewer_content(self, artifacts, temp_output_dir):
         """Test HTML viewer generation"""
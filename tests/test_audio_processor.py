@@ -1,22 +1,21 @@
 import os
-import shutil
 import tempfile
-from unittest.mock import MagicMock, Mock, call, patch
+import threading
+from unittest.mock import MagicMock, patch
 
 import pytest
-from pydub import AudioSegment
 
-from dnd_notetaker.audio_processor import AudioProcessor
+from dnd_notetaker.audio_processor import AudioProcessor, _probe_duration
 
 
 class TestAudioProcessor:
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def setup(self, temp_dir):
+        _probe_duration.cache_clear()
         self.processor = AudioProcessor()
-        self.temp_dir = tempfile.mkdtemp()
-
-    def teardown_method(self):
+        self.temp_dir = temp_dir
+        yield
         self.processor.cleanup()
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
 
     def test_init(self):
         assert self.processor.MAX_CHUNK_SIZE == 24 * 1024 * 1024
@@ -72,41 +71,81 @@ class TestAudioProcessor:
         with pytest.raises(ValueError, match="Path is not a file"):
             self.processor.verify_audio_file(self.temp_dir)
 
-    @patch("dnd_notetaker.audio_processor.VideoFileClip")
-    @patch("os.path.exists", return_value=True)
-    def test_extract_audio_success(self, mock_exists, mock_video_clip):
-        # Setup mocks
-        mock_video = MagicMock()
-        mock_video.duration = 100
-        mock_audio = MagicMock()
-        mock_video.audio = mock_audio
-        mock_video_clip.return_value = mock_video
-
-        # Call extract_audio
-        video_path = "test_video.mp4"
+    @patch("subprocess.run")
+    def test_extract_audio_success(self, mock_run):
+        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+        video_path = os.path.join(self.temp_dir, "test_video.mp4")
+        with open(video_path, "wb") as f:
+            f.write(b"video")
+
         output_path = self.processor.extract_audio(video_path, self.temp_dir)
 
-        # Verify
         assert output_path == os.path.join(self.temp_dir, "session_audio.mp3")
-        mock_video_clip.assert_called_once_with(video_path)
-        mock_audio.write_audiofile.assert_called_once()
-        mock_video.close.assert_called_once()
+        cmd = mock_run.call_args.args[0]
+        assert cmd[0] == "ffmpeg"
+        assert cmd[cmd.index("-i") + 1] == video_path
+        assert "-vn" in cmd
+        assert cmd[-1] == output_path
 
-    @patch("dnd_notetaker.audio_processor.VideoFileClip")
-    def test_extract_audio_file_not_found(self, mock_video_clip):
+    @patch("subprocess.run")
+    def test_extract_audio_file_not_found(self, mock_run):
         with pytest.raises(FileNotFoundError, match="Video file not found"):
             self.processor.extract_audio("/non/existent/video.mp4", self.temp_dir)
+        mock_run.assert_not_called()
+
+    @patch("subprocess.run")
+    def test_extract_audio_handles_ffmpeg_error(self, mock_run):
+        mock_run.return_value = MagicMock(returncode=1, stdout="", stderr="no audio stream")
+        video_path = os.path.join(self.temp_dir, "test_video.mp4")
+        with open(video_path, "wb") as f:
+            f.write(b"video")
+
+        with pytest.raises(Exception, match="ffmpeg failed: no audio stream"):
+            self.processor.extract_audio(video_path, self.temp_dir)
 
-    @patch("dnd_notetaker.audio_processor.VideoFileClip")
-    @patch("os.path.exists", return_value=True)
-    def test_extract_audio_handles_exception(self, mock_exists, mock_video_clip):
-        mock_video_clip.side_effect = Exception("Video processing error")
+    @patch("subprocess.run")
+    def test_get_audio_duration_cached(self, mock_run):
+        mock_run.return_value = MagicMock(returncode=0, stdout="123.4\n", stderr="")
 
-        with pytest.raises(Exception, match="Video processing error"):
-            self.processor.extract_audio("test_video.mp4", self.temp_dir)
+        test_file = os.path.join(self.temp_dir, "duration.mp3")
+        with open(test_file, "w") as f:
+            f.write("test")
 
-    @patch("os.path.getsize", return_value=1024)  # 1KB file
-    def test_split_audio_small_file(self, mock_getsize):
+        assert self.processor.get_audio_duration(test_file) == 123.4
+        # A new processor for the same unchanged file reuses the probe
+        assert AudioProcessor().get_audio_duration(test_file) == 123.4
+        assert mock_run.call_count == 1
+
+        # Changing the file invalidates the cached duration
+        with open(test_file, "a") as f:
+            f.write("more")
+        self.processor.get_audio_duration(test_file)
+        assert mock_run.call_count == 2
+
+    @patch("subprocess.run")
+    def test_get_audio_duration_failure_not_cached(self, mock_run):
+        mock_run.side_effect = [
+            MagicMock(returncode=1, stdout="", stderr="ffprobe error"),
+            MagicMock(returncode=0, stdout="123.4\n", stderr=""),
+        ]
+
+        test_file = os.path.join(self.temp_dir, "duration.mp3")
+        with open(test_file, "w") as f:
+            f.write("test")
+
+        assert self.processor.get_audio_duration(test_file) is None
+        # The same unchanged file is probed again after a failure
+        assert self.processor.get_audio_duration(test_file) == 123.4
+        assert mock_run.call_count == 2
+
+    @patch("subprocess.run")
+    def test_get_audio_duration_missing_file(self, mock_run):
+        missing = os.path.join(self.temp_dir, "missing.mp3")
+
+        assert self.processor.get_audio_duration(missing) is None
+        mock_run.assert_not_called()
+
+    def test_split_audio_small_file(self):
         # Create a test file
         test_file = os.path.join(self.temp_dir, "small_audio.mp3")
         with open(test_file, "w") as f:
@@ -122,10 +161,10 @@ class TestAudioProcessor:
         "dnd_notetaker.audio_processor.AudioProcessor.get_audio_duration",
         return_value=1800,
     )  # 30 minutes
-    @patch("os.path.getsize", return_value=50 * 1024 * 1024)  # 50MB
-    def test_split_audio_large_file(self, mock_getsize, mock_duration, mock_subprocess):
+    def test_split_audio_large_file(self, mock_duration, mock_subprocess):
         # Mock successful ffmpeg execution
         mock_subprocess.return_value = MagicMock(returncode=0, stdout="", stderr="")
+        self.processor.MAX_CHUNK_SIZE = 1  # Force splitting of the tiny test file
 
         # Create test file
         test_file = os.path.join(self.temp_dir, "large_audio.mp3")
@@ -146,9 +185,7 @@ class TestAudioProcessor:
             with patch("os.path.getsize") as mock_size:
 
                 def getsize_side_effect(path):
-                    if path == test_file:
-                        return 50 * 1024 * 1024
-                    elif "chunk_" in path:
+                    if "chunk_" in path:
                         return 10 * 1024 * 1024  # 10MB chunks
                     return 0
 
@@ -161,6 +198,120 @@ class TestAudioProcessor:
         assert all("chunk_" in path for path in result)
         assert mock_subprocess.call_count == 2  # Two ffmpeg calls
 
+    @patch("subprocess.run")
+    @patch(
+        "dnd_notetaker.audio_processor.AudioProcessor.get_audio_duration",
+        return_value=1800,
+    )  # 30 minutes
+    def test_split_audio_chunks_run_concurrently(self, mock_duration, mock_subprocess):
+        # Both ffmpeg calls must be in flight at once to pass the barrier;
+        # a sequential split would break it after the timeout
+        barrier = threading.Barrier(2, timeout=5)
+
+        def run_side_effect(cmd, **kwargs):
+            barrier.wait()
+            with open(cmd[-1], "w") as f:  # Write the chunk ffmpeg would
+                f.write("chunk")
+            return MagicMock(returncode=0, stdout="", stderr="")
+
+        mock_subprocess.side_effect = run_side_effect
+        self.processor.max_split_workers = 2
+        self.processor.MAX_CHUNK_SIZE = 1  # Force splitting of the tiny test file
+
+        test_file = os.path.join(self.temp_dir, "large_audio.mp3")
+        with open(test_file, "w") as f:
+            f.write("test")
+
+        result = self.processor.split_audio(test_file, self.temp_dir)
+
+        assert [os.path.basename(p) for p in result] == ["chunk_1.mp3", "chunk_2.mp3"]
+
+    @patch("subprocess.run")
+    @patch(
+        "dnd_notetaker.audio_processor.AudioProcessor.get_audio_duration",
+        return_value=1800,
+    )  # 30 minutes
+    def test_split_audio_stream_copies_extracted_mp3(self, mock_duration, mock_subprocess):
+        mock_subprocess.return_value = MagicMock(returncode=0, stdout="", stderr="")
+
+        # 30 minutes of 128 kbps CBR, as AudioExtractor writes it, plus a
+        # little ID3/Xing header overhead
+        test_file = os.path.join(self.temp_dir, "audio.mp3")
+        with open(test_file, "wb") as f:
+            f.truncate(128 * 1000 // 8 * 1800 + 4096)
+
+        self.processor.split_audio(test_file, self.temp_dir)
+
+        assert mock_subprocess.call_count == 2
+        for c in mock_subprocess.call_args_list:
+            cmd = c.args[0]
+            assert cmd[cmd.index("-acodec") + 1] == "copy"
+
+    @patch("subprocess.run")
+    @patch(
+        "dnd_notetaker.audio_processor.AudioProcessor.get_audio_duration",
+        return_value=1800,
+    )  # 30 minutes
+    def test_split_audio_reencodes_high_bitrate_mp3(self, mock_duration, mock_subprocess):
+        mock_subprocess.return_value = MagicMock(returncode=0, stdout="", stderr="")
+
+        # 30 minutes at 320 kbps; copied 15 minute chunks would be ~36MB
+        test_file = os.path.join(self.temp_dir, "high_bitrate.mp3")
+        with open(test_file, "wb") as f:
+            f.truncate(320 * 1000 // 8 * 1800)
+
+        self.processor.split_audio(test_file, self.temp_dir)
+
+        assert mock_subprocess.call_count == 2
+        for c in mock_subprocess.call_args_list:
+            cmd = c.args[0]
+            assert cmd[cmd.index("-acodec") + 1] == "mp3"
+            assert cmd[cmd.index("-b:a") + 1] == str(self.processor.CHUNK_BITRATE)
+
+    @patch("subprocess.run")
+    @patch(
+        "dnd_notetaker.audio_processor.AudioProcessor.get_audio_duration",
+        return_value=None,
+    )
+    def test_split_audio_reencodes_when_duration_unknown(self, mock_duration, mock_subprocess):
+        mock_subprocess.return_value = MagicMock(returncode=0, stdout="", stderr="")
+
+        # 30 minutes at 320 kbps; the 128 kbps duration estimate would make
+        # it look like a low-bitrate file
+        test_file = os.path.join(self.temp_dir, "high_bitrate.mp3")
+        with open(test_file, "wb") as f:
+            f.truncate(320 * 1000 // 8 * 1800)
+
+        self.processor.split_audio(test_file, self.temp_dir)
+
+        assert mock_subprocess.call_count > 1
+        for c in mock_subprocess.call_args_list:
+            cmd = c.args[0]
+            assert cmd[cmd.index("-acodec") + 1] == "mp3"
+
+    @patch("subprocess.run")
+    def test_split_audio_stats_input_once(self, mock_subprocess):
+        def run_side_effect(cmd, **kwargs):
+            if cmd[0] == "ffmpeg":
+                with open(cmd[-1], "w") as f:  # Write the chunk ffmpeg would
+                    f.write("chunk")
+            # ffprobe reports 30 minutes
+            return MagicMock(returncode=0, stdout="1800", stderr="")
+
+        mock_subprocess.side_effect = run_side_effect
+        self.processor.MAX_CHUNK_SIZE = 1  # Force splitting of the tiny test file
+
+        test_file = os.path.join(self.temp_dir, "large_audio.mp3")
+        with open(test_file, "w") as f:
+            f.write("test")
+
+        with patch("os.stat", wraps=os.stat) as mock_stat:
+            result = self.processor.split_audio(test_file, self.temp_dir)
+
+        assert len(result) == 2
+        input_stats = [c for c in mock_stat.call_args_list if c.args[0] == test_file]
+        assert len(input_stats) == 1
+
     def test_split_audio_invalid_file(self):
         with pytest.raises(FileNotFoundError):
             self.processor.split_audio("/non/existent/audio.mp3", self.temp_dir)
@@ -170,14 +321,12 @@ class TestAudioProcessor:
         "dnd_notetaker.audio_processor.AudioProcessor.get_audio_duration",
         return_value=1800,
     )  # 30 minutes
-    @patch("os.path.getsize", return_value=50 * 1024 * 1024)
-    def test_split_audio_handles_processing_error(
-        self, mock_getsize, mock_duration, mock_subprocess
-    ):
+    def test_split_audio_handles_processing_error(self, mock_duration, mock_subprocess):
         # Mock ffmpeg failure
         mock_subprocess.return_value = MagicMock(
             returncode=1, stdout="", stderr="ffmpeg error"
         )
+        self.processor.MAX_CHUNK_SIZE = 1  # Force splitting of the tiny test file
 
         test_file = os.path.join(self.temp_dir, "error_audio.mp3")
         with open(test_file, "w") as f:
@@ -2,7 +2,6 @@
 
 import pytest
 import json
-import tempfile
 from pathlib import Path
 from unittest.mock import patch, mock_open
 
@@ -57,13 +56,26 @@ class TestConfig:
         with pytest.raises(ValueError, match="OpenAI API key not configured"):
             _ = config.openai_api_key
     
-    def test_service_account_path_property(self):
+    @pytest.mark.parametrize("config_data, expected", [
+        ({}, 1),
+        ({"note_generation_workers": 3}, 3),
+        ({"note_generation_workers": 0}, 1),
+    ])
+    def test_note_generation_workers_property(self, config_data, expected):
+        """Test note generation concurrency defaults to sequential"""
+        config = Config()
+        config._config = config_data
+        
+        assert config.note_generation_workers == expected
+    
+    def test_service_account_path_property(self, tmp_path):
         """Test service account path property"""
-        with tempfile.NamedTemporaryFile() as tf:
-            config = Config()
-            config._config = {"google_service_account": tf.name}
-            
-            assert config.service_account_path == Path(tf.name)
+        service_account = tmp_path / "service.json"
+        service_account.write_text("{}")
+        config = Config()
+        config._config = {"google_service_account": str(service_account)}
+        
+        assert config.service_account_path == service_account
     
     def test_service_account_path_missing_raises_error(self):
         """Test error when service account file doesn't exist"""
@@ -73,26 +85,36 @@ class TestConfig:
         with pytest.raises(ValueError, match="Service account file not found"):
             _ = config.service_account_path
     
-    def test_output_dir_property(self):
+    def test_output_dir_property(self, tmp_path):
         """Test output directory property"""
-        with tempfile.TemporaryDirectory() as td:
-            config = Config()
-            config._config = {"output_dir": td}
-            
-            output_dir = config.output_dir
-            assert output_dir == Path(td)
-            assert output_dir.exists()
+        config = Config()
+        config._config = {"output_dir": str(tmp_path)}
+        
+        output_dir = config.output_dir
+        assert output_dir == tmp_path
+        assert output_dir.exists()
     
-    def test_output_dir_creates_if_missing(self):
+    def test_output_dir_creates_if_missing(self, tmp_path):
         """Test output directory is created if it doesn't exist"""
-        with tempfile.TemporaryDirectory() as td:
-            new_dir = Path(td) / "new_output"
-            config = Config()
-            config._config = {"output_dir": str(new_dir)}
-            
-            output_dir = config.output_dir
-            assert output_dir.exists()
-            assert output_dir == new_dir
+        new_dir = tmp_path / "new_output"
+        config = Config()
+        config._config = {"output_dir": str(new_dir)}
+        
+        output_dir = config.output_dir
+        assert output_dir.exists()
+        assert output_dir == new_dir
+    
+    def test_output_dir_created_once(self, tmp_path):
+        """Test repeated output_dir reads only create the directory once"""
+        config = Config()
+        config._config = {"output_dir": str(tmp_path / "new_output")}
+        
+        with patch('pathlib.Path.mkdir') as mock_mkdir:
+            first = config.output_dir
+            second = config.output_dir
+        
+        assert first == second
+        mock_mkdir.assert_called_once_with(parents=True, exist_ok=True)
     
     def test_dry_run_flag(self):
         """Test that Config properly stores dry_run flag"""
@@ -125,13 +147,12 @@ class TestConfig:
         assert config.openai_api_key == ""
         assert config.service_account_path == Path("/nonexistent")
     
-    def test_dry_run_no_output_dir_creation(self):
+    def test_dry_run_no_output_dir_creation(self, tmp_path):
         """Test that dry_run mode doesn't create output directory"""
-        with tempfile.TemporaryDirectory() as td:
-            new_dir = Path(td) / "should_not_exist"
-            config = Config(dry_run=True)
-            config._config = {"output_dir": str(new_dir)}
-            
-            output_dir = config.output_dir
-            assert not new_dir.exists()  # Directory should not be created
-            assert output_dir == new_dir
\ No newline at end of file
+        new_dir = tmp_path / "should_not_exist"
+        config = Config(dry_run=True)
+        config._config = {"output_dir": str(new_dir)}
+        
+        output_dir = config.output_dir
+        assert not new_dir.exists()  # Directory should not be created
+        assert output_dir == new_dir
\ No newline at end of file
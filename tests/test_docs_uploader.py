@@ -1,4 +1,4 @@
-from unittest.mock import MagicMock, Mock, call, patch
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -7,7 +7,7 @@ from dnd_notetaker.docs_uploader import DocsUploader
 
 class TestDocsUploader:
     @patch("dnd_notetaker.docs_uploader.GoogleAuthenticator")
-    def test_upload_notes_with_public_sharing(self, mock_auth):
+    def test_upload_notes_with_public_sharing(self, mock_auth, tmp_path):
         """Test that documents are shared publicly by default"""
         # Setup mocks with proper chaining
         mock_drive_service = Mock()
@@ -42,41 +42,32 @@ class TestDocsUploader:
         uploader.setup_services()
 
         # Create a temporary file for testing
-        import tempfile
+        test_file = tmp_path / "notes.txt"
+        test_file.write_text("Test content")
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-            f.write("Test content")
-            test_file = f.name
+        # Test upload with default public sharing
+        doc_url = uploader.upload_notes(str(test_file), title="Test Doc")
 
-        try:
-            # Test upload with default public sharing
-            doc_url = uploader.upload_notes(test_file, title="Test Doc")
-
-            # Verify document was created
-            mock_docs_service.documents.return_value.create.assert_called_once_with(
-                body={"title": "Test Doc"}
-            )
-
-            # Verify document was updated with content
-            mock_docs_service.documents.return_value.batchUpdate.assert_called_once()
-
-            # Verify public sharing was applied
-            mock_drive_service.permissions.return_value.create.assert_called_once()
-            perm_call = mock_drive_service.permissions.return_value.create.call_args
-            assert perm_call[1]["body"]["type"] == "anyone"
-            assert perm_call[1]["body"]["role"] == "reader"
-            assert perm_call[1]["fileId"] == "test-doc-id"
+        # Verify document was created
+        mock_docs_service.documents.return_value.create.assert_called_once_with(
+            body={"title": "Test Doc"}
+        )
 
-            # Verify the returned URL
-            assert doc_url == "https://docs.google.com/document/d/test-doc-id/edit"
+        # Verify document was updated with content
+        mock_docs_service.documents.return_value.batchUpdate.assert_called_once()
 
-        finally:
-            import os
+        # Verify public sharing was applied
+        mock_drive_service.permissions.return_value.create.assert_called_once()
+        perm_call = mock_drive_service.permissions.return_value.create.call_args
+        assert perm_call.kwargs["body"]["type"] == "anyone"
+        assert perm_call.kwargs["body"]["role"] == "reader"
+        assert perm_call.kwargs["fileId"] == "test-doc-id"
 
-            os.unlink(test_file)
+        # Verify the returned URL
+        assert doc_url == "https://docs.google.com/document/d/test-doc-id/edit"
 
     @patch("dnd_notetaker.docs_uploader.GoogleAuthenticator")
-    def test_upload_notes_without_public_sharing(self, mock_auth):
+    def test_upload_notes_without_public_sharing(self, mock_auth, tmp_path):
         """Test that public sharing can be disabled"""
         # Setup mocks with proper chaining
         mock_drive_service = Mock()
@@ -111,31 +102,22 @@ class TestDocsUploader:
         uploader.setup_services()
 
         # Create a temporary file for testing
-        import tempfile
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-            f.write("Test content")
-            test_file = f.name
+        test_file = tmp_path / "notes.txt"
+        test_file.write_text("Test content")
 
-        try:
-            # Test upload without public sharing
-            doc_url = uploader.upload_notes(
-                test_file, title="Test Doc", share_publicly=False
-            )
-
-            # Verify document was created and updated
-            mock_docs_service.documents.return_value.create.assert_called_once_with(
-                body={"title": "Test Doc"}
-            )
-            mock_docs_service.documents.return_value.batchUpdate.assert_called_once()
-
-            # Verify NO sharing permissions were applied
-            mock_drive_service.permissions.return_value.create.assert_not_called()
+        # Test upload without public sharing
+        doc_url = uploader.upload_notes(
+            str(test_file), title="Test Doc", share_publicly=False
+        )
 
-            # Verify the returned URL
-            assert doc_url == "https://docs.google.com/document/d/test-doc-id/edit"
+        # Verify document was created and updated
+        mock_docs_service.documents.return_value.create.assert_called_once_with(
+            body={"title": "Test Doc"}
+        )
+        mock_docs_service.documents.return_value.batchUpdate.assert_called_once()
 
-        finally:
-            import os
+        # Verify NO sharing permissions were applied
+        mock_drive_service.permissions.return_value.create.assert_not_called()
 
-            os.unlink(test_file)
+        # Verify the returned URL
+        assert doc_url == "https://docs.google.com/document/d/test-doc-id/edit"
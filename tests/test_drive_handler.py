@@ -1,7 +1,4 @@
 import os
-import shutil
-import tempfile
-from io import BytesIO
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
@@ -12,21 +9,21 @@ from dnd_notetaker.drive_handler import DriveHandler
 class TestDriveHandler:
     """Test drive handler functionality"""
 
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def setup(self, temp_dir):
         """Set up test environment"""
-        self.test_dir = tempfile.mkdtemp()
+        self.test_dir = temp_dir
 
-    def teardown_method(self):
-        """Clean up test environment"""
-        if os.path.exists(self.test_dir):
-            shutil.rmtree(self.test_dir)
+    @pytest.fixture
+    def mock_drive_service(self):
+        """Patch Drive authentication and return the mocked Drive service"""
+        with patch("dnd_notetaker.drive_handler.GoogleAuthenticator") as mock_auth:
+            mock_drive_service = Mock()
+            mock_auth.return_value.get_services.return_value = (mock_drive_service, Mock())
+            yield mock_drive_service
 
-    @patch("dnd_notetaker.drive_handler.GoogleAuthenticator")
-    def test_download_file_creates_directory(self, mock_auth):
+    def test_download_file_creates_directory(self, mock_drive_service):
         """Test that download_file creates the directory if it doesn't exist"""
-        # Mock the authentication
-        mock_drive_service = Mock()
-        mock_auth.return_value.get_services.return_value = (mock_drive_service, Mock())
 
         # Create handler
         handler = DriveHandler()
@@ -65,12 +62,8 @@ class TestDriveHandler:
                     assert os.path.exists(download_dir)
                     assert result == os.path.join(download_dir, "test_video.mp4")
 
-    @patch("dnd_notetaker.drive_handler.GoogleAuthenticator")
-    def test_download_file_handles_complex_filename(self, mock_auth):
+    def test_download_file_handles_complex_filename(self, mock_drive_service):
         """Test that download handles complex filenames with special characters"""
-        # Mock the authentication
-        mock_drive_service = Mock()
-        mock_auth.return_value.get_services.return_value = (mock_drive_service, Mock())
 
         # Create handler
         handler = DriveHandler()
@@ -119,34 +112,21 @@ class TestDriveHandler:
                     # Verify open was called with the correct path
                     mock_open.assert_called_once_with(expected_path, "wb")
 
-    @patch("dnd_notetaker.drive_handler.GoogleAuthenticator")
-    def test_sanitize_filename(self, mock_auth):
+    @pytest.mark.parametrize("input_name,expected", [
+        ("normal_file.mp4", "normal_file.mp4"),
+        ("file/with/slashes.mp4", "file-with-slashes.mp4"),
+        ("file:with:colons.mp4", "file-with-colons.mp4"),
+        ("file\\with\\backslashes.mp4", "file-with-backslashes.mp4"),
+        ("file<>with|special*chars?.mp4", "file--with-special-chars-.mp4"),
+    ])
+    def test_sanitize_filename(self, mock_drive_service, input_name, expected):
         """Test filename sanitization"""
-        # Mock the authentication
-        mock_drive_service = Mock()
-        mock_auth.return_value.get_services.return_value = (mock_drive_service, Mock())
-        
         handler = DriveHandler()
 
-        # Test various problematic filenames
-        test_cases = [
-            ("normal_file.mp4", "normal_file.mp4"),
-            ("file/with/slashes.mp4", "file-with-slashes.mp4"),
-            ("file:with:colons.mp4", "file-with-colons.mp4"),
-            ("file\\with\\backslashes.mp4", "file-with-backslashes.mp4"),
-            ("file<>with|special*chars?.mp4", "file--with-special-chars-.mp4"),
-        ]
-
-        for input_name, expected in test_cases:
-            assert handler.sanitize_filename(input_name) == expected
+        assert handler.sanitize_filename(input_name) == expected
 
-    @patch("dnd_notetaker.drive_handler.GoogleAuthenticator")
-    def test_list_recordings(self, mock_auth):
+    def test_list_recordings(self, mock_drive_service):
         """Test listing recordings from Drive folder"""
-        # Mock the authentication
-        mock_drive_service = Mock()
-        mock_auth.return_value.get_services.return_value = (mock_drive_service, Mock())
-        
         handler = DriveHandler()
         
         # Mock the Drive API response
@@ -190,15 +170,11 @@ class TestDriveHandler:
         # Verify the API was called with correct parameters
         mock_drive_service.files.return_value.list.assert_called_once()
         call_args = mock_drive_service.files.return_value.list.call_args
-        assert "14EVI64FlpZCwRy4UL4ZhGjlsjK55XL1h" in call_args[1]["q"]
+        assert "14EVI64FlpZCwRy4UL4ZhGjlsjK55XL1h" in call_args.kwargs["q"]
+        assert "trashed = false" in call_args.kwargs["q"]
 
-    @patch("dnd_notetaker.drive_handler.GoogleAuthenticator")
-    def test_find_recording_by_name(self, mock_auth):
+    def test_find_recording_by_name(self, mock_drive_service):
         """Test finding a recording by name filter"""
-        # Mock the authentication
-        mock_drive_service = Mock()
-        mock_auth.return_value.get_services.return_value = (mock_drive_service, Mock())
-        
         handler = DriveHandler()
         
         # Mock the list_recordings response
@@ -231,6 +207,49 @@ class TestDriveHandler:
             result = handler.find_recording_by_name("nonexistent")
             assert result is None
 
+    def test_download_recording_reuses_listing_metadata(self, mock_drive_service):
+        """Test that downloading a listed recording skips the files().get round trip"""
+        handler = DriveHandler()
+        mock_drive_service.files.return_value.list.return_value.execute.return_value = {
+            "files": [
+                {
+                    "id": "file1",
+                    "name": "DnD - 2025-01-10 Recording.mp4",
+                    "size": "5",
+                    "mimeType": "video/mp4",
+                }
+            ]
+        }
+        mock_downloader = Mock()
+        mock_downloader.next_chunk.return_value = (None, True)
+
+        with patch(
+            "dnd_notetaker.drive_handler.MediaIoBaseDownload",
+            return_value=mock_downloader,
+        ):
+            result = handler.download_recording("2025-01-10", self.test_dir)
+
+        assert result == os.path.join(self.test_dir, "DnD - 2025-01-10 Recording.mp4")
+        mock_drive_service.files.return_value.get.assert_not_called()
+        mock_drive_service.files.return_value.get_media.assert_called_once_with(
+            fileId="file1"
+        )
+
+    def test_check_existing_downloads(self, mock_drive_service):
+        """Test existing download lookup skips unrelated entries"""
+        handler = DriveHandler()
+
+        for i in range(10):
+            open(os.path.join(self.test_dir, f"other_{i}.txt"), "w").close()
+        # A directory with a matching name must not be returned
+        os.mkdir(os.path.join(self.test_dir, "DnD - folder.mp4"))
+        match = os.path.join(self.test_dir, "DnD - 2025-01-10 Recording.mp4")
+        with open(match, "wb") as f:
+            f.write(b"video")
+
+        assert handler.check_existing_downloads("2025-01-10", self.test_dir) == match
+        assert handler.check_existing_downloads("x", os.path.join(self.test_dir, "missing")) is None
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
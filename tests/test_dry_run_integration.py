@@ -3,33 +3,83 @@
 import pytest
 import subprocess
 import sys
-import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import patch, Mock
 import json
 
+from dnd_notetaker.meet_notes import main
+
+
+def _write_config(config_dir: Path) -> Path:
+    """Write a minimal config file with no credentials"""
+    config_file = config_dir / "config.json"
+    config_data = {
+        "openai_api_key": "",
+        "google_service_account": str(config_dir / "service_account.json"),
+        "output_dir": str(config_dir / "output")
+    }
+    config_file.write_text(json.dumps(config_data))
+    return config_file
+
+
+def _run_cli(args, **kwargs):
+    """Run the package entry point in a fresh interpreter"""
+    return subprocess.run(
+        [sys.executable, "-m", "dnd_notetaker", *args],
+        capture_output=True, text=True, **kwargs
+    )
+
+
+@pytest.fixture(scope="module")
+def cli_runs(tmp_path_factory):
+    """Run every CLI smoke invocation once, concurrently
+    
+    Each invocation is an independent interpreter that spends most of its
+    time importing dependencies, so running them side by side cuts the wall
+    time to roughly that of the slowest single run.
+    """
+    full_dir = tmp_path_factory.mktemp("full_pipeline")
+    no_file_id_dir = tmp_path_factory.mktemp("no_file_id")
+    custom_dir = tmp_path_factory.mktemp("custom_output") / "custom_output"
+    
+    invocations = {
+        "full_pipeline": ([
+            "TEST_FILE_ID", "--dry-run",
+            "--config", str(_write_config(full_dir)),
+            "--output-dir", str(full_dir / "output")
+        ], {}),
+        "no_file_id": ([
+            "--dry-run",
+            "--config", str(_write_config(no_file_id_dir))
+        ], {}),
+        "no_credentials": (["TEST_FILE_ID", "--dry-run"], {"env": {}}),
+        "custom_output_dir": ([
+            "TEST_FILE_ID", "--dry-run",
+            "--output-dir", str(custom_dir)
+        ], {}),
+    }
+    
+    with ThreadPoolExecutor(max_workers=len(invocations)) as executor:
+        futures = {
+            name: executor.submit(_run_cli, args, **kwargs)
+            for name, (args, kwargs) in invocations.items()
+        }
+        results = {name: future.result() for name, future in futures.items()}
+    
+    return {
+        "results": results,
+        "full_dir": full_dir,
+        "custom_dir": custom_dir,
+    }
+
 
 class TestDryRunIntegration:
     """Test complete pipeline in dry-run mode"""
     
-    def test_full_pipeline_dry_run(self, tmp_path, capsys):
+    def test_full_pipeline_dry_run(self, cli_runs):
         """Test complete pipeline in dry-run mode"""
-        # Create a minimal config file
-        config_file = tmp_path / "config.json"
-        config_data = {
-            "openai_api_key": "",
-            "google_service_account": str(tmp_path / "service_account.json"),
-            "output_dir": str(tmp_path / "output")
-        }
-        config_file.write_text(json.dumps(config_data))
-        
-        # Run with dry-run flag
-        result = subprocess.run([
-            sys.executable, "-m", "dnd_notetaker", 
-            "TEST_FILE_ID", "--dry-run",
-            "--config", str(config_file),
-            "--output-dir", str(tmp_path / "output")
-        ], capture_output=True, text=True)
+        result = cli_runs["results"]["full_pipeline"]
         
         # Should complete successfully
         assert result.returncode == 0
@@ -43,7 +93,7 @@ class TestDryRunIntegration:
         assert "[DRY RUN] Would save artifacts to:" in output
         
         # Verify no files were created in output directory
-        output_dir = tmp_path / "output"
+        output_dir = cli_runs["full_dir"] / "output"
         if output_dir.exists():
             assert len(list(output_dir.iterdir())) == 0
         
@@ -51,23 +101,9 @@ class TestDryRunIntegration:
         assert "Error" not in output
         assert "Exception" not in output
     
-    def test_dry_run_no_file_id(self, tmp_path):
+    def test_dry_run_no_file_id(self, cli_runs):
         """Test dry-run without file ID"""
-        # Create a minimal config file
-        config_file = tmp_path / "config.json"
-        config_data = {
-            "openai_api_key": "",
-            "google_service_account": str(tmp_path / "service_account.json"),
-            "output_dir": str(tmp_path / "output")
-        }
-        config_file.write_text(json.dumps(config_data))
-        
-        # Run without file ID
-        result = subprocess.run([
-            sys.executable, "-m", "dnd_notetaker", 
-            "--dry-run",
-            "--config", str(config_file)
-        ], capture_output=True, text=True)
+        result = cli_runs["results"]["no_file_id"]
         
         # Should complete successfully
         assert result.returncode == 0
@@ -75,27 +111,18 @@ class TestDryRunIntegration:
         # Should show search for most recent
         assert "[DRY RUN] Would search for most recent" in result.stdout
     
-    def test_dry_run_no_credentials(self):
+    def test_dry_run_no_credentials(self, cli_runs):
         """Test dry-run without any credentials"""
-        # Run with non-existent config
-        result = subprocess.run([
-            sys.executable, "-m", "dnd_notetaker",
-            "TEST_FILE_ID", "--dry-run"
-        ], capture_output=True, text=True, env={})
+        result = cli_runs["results"]["no_credentials"]
         
         # Should complete successfully without errors
         assert result.returncode == 0
         assert "[DRY RUN]" in result.stdout
     
-    def test_dry_run_custom_output_dir(self, tmp_path):
+    def test_dry_run_custom_output_dir(self, cli_runs):
         """Test dry-run with custom output directory"""
-        custom_dir = tmp_path / "custom_output"
-        
-        result = subprocess.run([
-            sys.executable, "-m", "dnd_notetaker",
-            "TEST_FILE_ID", "--dry-run",
-            "--output-dir", str(custom_dir)
-        ], capture_output=True, text=True)
+        result = cli_runs["results"]["custom_output_dir"]
+        custom_dir = cli_runs["custom_dir"]
         
         # Should complete successfully
         assert result.returncode == 0
@@ -108,9 +135,6 @@ class TestDryRunIntegration:
     
     def test_dry_run_component_interactions(self):
         """Test that all components receive dry_run config"""
-        from dnd_notetaker.meet_notes import main
-        from dnd_notetaker.config import Config
-        
         with patch('dnd_notetaker.meet_notes.MeetProcessor') as mock_processor_class:
             # Mock the processor
             mock_processor = Mock()
@@ -1,7 +1,7 @@
 """Tests for the simplified meet_notes entry point"""
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch
 from pathlib import Path
 import sys
 
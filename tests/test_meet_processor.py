@@ -1,9 +1,10 @@
 """Tests for the MeetProcessor orchestrator"""
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock, call
+from unittest.mock import DEFAULT, Mock, patch
 from pathlib import Path
 import tempfile
+from types import SimpleNamespace
 
 from dnd_notetaker.meet_processor import MeetProcessor
 
@@ -13,12 +14,29 @@ class TestMeetProcessor:
     
     @pytest.fixture
     def mock_config(self):
-        """Create mock config"""
-        config = Mock()
-        config.service_account_path = Path("/path/to/service.json")
-        config.openai_api_key = "test-key"
-        config.dry_run = False
-        return config
+        """Create mock config
+        
+        Only plain attributes are read from it, so a namespace is enough.
+        """
+        return SimpleNamespace(
+            service_account_path=Path("/path/to/service.json"),
+            openai_api_key="test-key",
+            dry_run=False,
+        )
+    
+    @pytest.fixture
+    def components(self):
+        """Patch every pipeline component (and tqdm) in one go"""
+        with patch.multiple(
+            'dnd_notetaker.meet_processor',
+            SimplifiedDriveHandler=DEFAULT,
+            AudioExtractor=DEFAULT,
+            Transcriber=DEFAULT,
+            NoteGenerator=DEFAULT,
+            Artifacts=DEFAULT,
+            tqdm=DEFAULT,
+        ) as mocks:
+            yield mocks
     
     @pytest.fixture
     def temp_output_dir(self):
@@ -26,32 +44,20 @@ class TestMeetProcessor:
         with tempfile.TemporaryDirectory() as td:
             yield Path(td)
     
-    @patch('dnd_notetaker.meet_processor.SimplifiedDriveHandler')
-    @patch('dnd_notetaker.meet_processor.AudioExtractor')
-    @patch('dnd_notetaker.meet_processor.Transcriber')
-    @patch('dnd_notetaker.meet_processor.NoteGenerator')
-    @patch('dnd_notetaker.meet_processor.Artifacts')
-    def test_init(self, mock_artifacts, mock_notes, mock_trans, mock_audio, mock_drive, 
-                  mock_config, temp_output_dir):
+    def test_init(self, components, mock_config, temp_output_dir):
         """Test processor initialization"""
         processor = MeetProcessor(mock_config, temp_output_dir)
         
         # Verify components were initialized
-        mock_drive.assert_called_once_with(mock_config.service_account_path, mock_config)
-        mock_audio.assert_called_once_with(mock_config)
-        mock_trans.assert_called_once_with(mock_config.openai_api_key, mock_config)
-        mock_notes.assert_called_once_with(mock_config.openai_api_key, mock_config)
-        mock_artifacts.assert_called_once_with(temp_output_dir, mock_config)
+        components['SimplifiedDriveHandler'].assert_called_once_with(
+            mock_config.service_account_path, mock_config
+        )
+        components['AudioExtractor'].assert_called_once_with(mock_config)
+        components['Transcriber'].assert_called_once_with(mock_config.openai_api_key, mock_config)
+        components['NoteGenerator'].assert_called_once_with(mock_config.openai_api_key, mock_config)
+        components['Artifacts'].assert_called_once_with(temp_output_dir, mock_config)
     
-    @patch('dnd_notetaker.meet_processor.SimplifiedDriveHandler')
-    @patch('dnd_notetaker.meet_processor.AudioExtractor')
-    @patch('dnd_notetaker.meet_processor.Transcriber')
-    @patch('dnd_notetaker.meet_processor.NoteGenerator')
-    @patch('dnd_notetaker.meet_processor.Artifacts')
-    @patch('dnd_notetaker.meet_processor.tqdm')
-    def test_process_full_pipeline(self, mock_tqdm, mock_artifacts_class, mock_notes_class, 
-                                  mock_trans_class, mock_audio_class, mock_drive_class,
-                                  mock_config, temp_output_dir):
+    def test_process_full_pipeline(self, components, mock_config, temp_output_dir):
         """Test full processing pipeline"""
         # Create test files
         video_path = temp_output_dir / "test.mp4"
@@ -86,15 +92,7 @@ class TestMeetProcessor:
         assert (temp_output_dir / "transcript.txt").exists()
         assert (temp_output_dir / "notes.txt").exists()
     
-    @patch('dnd_notetaker.meet_processor.SimplifiedDriveHandler')
-    @patch('dnd_notetaker.meet_processor.AudioExtractor')
-    @patch('dnd_notetaker.meet_processor.Transcriber')
-    @patch('dnd_notetaker.meet_processor.NoteGenerator')
-    @patch('dnd_notetaker.meet_processor.Artifacts')
-    @patch('dnd_notetaker.meet_processor.tqdm')
-    def test_process_with_file_id(self, mock_tqdm, mock_artifacts_class, mock_notes_class, 
-                                 mock_trans_class, mock_audio_class, mock_drive_class,
-                                 mock_config, temp_output_dir):
+    def test_process_with_file_id(self, components, mock_config, temp_output_dir):
         """Test processing with specific file ID"""
         # Create test files
         video_path = temp_output_dir / "test.mp4"
@@ -122,15 +120,7 @@ class TestMeetProcessor:
         processor.drive_handler.download_file.assert_called_once_with(test_file_id, temp_output_dir)
         processor.drive_handler.download_most_recent.assert_not_called()
     
-    @patch('dnd_notetaker.meet_processor.SimplifiedDriveHandler')
-    @patch('dnd_notetaker.meet_processor.AudioExtractor')
-    @patch('dnd_notetaker.meet_processor.Transcriber')
-    @patch('dnd_notetaker.meet_processor.NoteGenerator')
-    @patch('dnd_notetaker.meet_processor.Artifacts')
-    @patch('dnd_notetaker.meet_processor.tqdm')
-    def test_checkpointing_skips_existing_audio(self, mock_tqdm, mock_artifacts_class, mock_notes_class, 
-                                               mock_trans_class, mock_audio_class, mock_drive_class,
-                                               mock_config, temp_output_dir):
+    def test_checkpointing_skips_existing_audio(self, components, mock_config, temp_output_dir):
         """Test that existing audio file is not re-extracted"""
         # Create existing audio file
         audio_path = temp_output_dir / "audio.mp3"
@@ -159,15 +149,7 @@ class TestMeetProcessor:
         # Verify audio extraction was skipped
         processor.audio_extractor.extract.assert_not_called()
     
-    @patch('dnd_notetaker.meet_processor.SimplifiedDriveHandler')
-    @patch('dnd_notetaker.meet_processor.AudioExtractor')
-    @patch('dnd_notetaker.meet_processor.Transcriber')
-    @patch('dnd_notetaker.meet_processor.NoteGenerator')
-    @patch('dnd_notetaker.meet_processor.Artifacts')
-    @patch('dnd_notetaker.meet_processor.tqdm')
-    def test_checkpointing_skips_existing_transcript(self, mock_tqdm, mock_artifacts_class, mock_notes_class, 
-                                                    mock_trans_class, mock_audio_class, mock_drive_class,
-                                                    mock_config, temp_output_dir):
+    def test_checkpointing_skips_existing_transcript(self, components, mock_config, temp_output_dir):
         """Test that existing transcript is not re-generated"""
         # Create existing files
         audio_path = temp_output_dir / "audio.mp3"
@@ -198,15 +180,7 @@ class TestMeetProcessor:
         # Verify note generation used existing transcript
         processor.note_generator.generate.assert_called_once_with("existing transcript")
     
-    @patch('dnd_notetaker.meet_processor.SimplifiedDriveHandler')
-    @patch('dnd_notetaker.meet_processor.AudioExtractor')
-    @patch('dnd_notetaker.meet_processor.Transcriber')
-    @patch('dnd_notetaker.meet_processor.NoteGenerator')
-    @patch('dnd_notetaker.meet_processor.Artifacts')
-    @patch('dnd_notetaker.meet_processor.tqdm')
-    def test_notes_always_regenerated(self, mock_tqdm, mock_artifacts_class, mock_notes_class, 
-                                     mock_trans_class, mock_audio_class, mock_drive_class,
-                                     mock_config, temp_output_dir):
+    def test_notes_always_regenerated(self, components, mock_config, temp_output_dir):
         """Test that notes are always regenerated even if they exist"""
         # Create all existing files
         audio_path = temp_output_dir / "audio.mp3"
@@ -1,11 +1,12 @@
 """Tests for the prose-style note generator"""
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
-import openai
+import re
+import threading
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
 
 from dnd_notetaker.note_generator import NoteGenerator
-from dnd_notetaker.config import Config
 
 
 class TestNoteGenerator:
@@ -14,8 +15,7 @@ class TestNoteGenerator:
     @pytest.fixture
     def generator(self):
         """Create note generator with mock client"""
-        mock_config = Mock(spec=Config)
-        mock_config.dry_run = False
+        mock_config = SimpleNamespace(dry_run=False, note_generation_workers=1)
         with patch('openai.OpenAI'):
             return NoteGenerator("test-api-key", mock_config)
     
@@ -29,11 +29,11 @@ class TestNoteGenerator:
     
     def test_init(self):
         """Test note generator initialization"""
-        mock_config = Mock(spec=Config)
-        mock_config.dry_run = False
+        mock_config = SimpleNamespace(dry_run=False, note_generation_workers=1)
         with patch('openai.OpenAI') as mock_openai:
             generator = NoteGenerator("test-key", config=mock_config, max_tokens=1000)
             mock_openai.assert_called_once_with(api_key="test-key")
+        assert generator.max_workers == 1
     
     def test_generate_single_chunk(self, generator, mock_response):
         """Test generating notes from a single chunk transcript"""
@@ -92,6 +92,37 @@ class TestNoteGenerator:
         assert result == "Combined final notes"
         assert generator.client.chat.completions.create.call_count == expected_chunks + 1  # chunks + 1 combination
     
+    def test_generate_multiple_chunks_keeps_order(self):
+        """Test chunk summaries run concurrently and are combined in order"""
+        mock_config = SimpleNamespace(dry_run=False, note_generation_workers=4)
+        with patch('openai.OpenAI'):
+            generator = NoteGenerator("test-api-key", mock_config)
+        long_transcript = "This is a very long transcript. " * 30000
+        total = len(generator._split_transcript(long_transcript))
+        assert 1 < total <= generator.max_workers
+        # Every chunk summary must be in flight at once to pass the barrier;
+        # a sequential loop would break it after the timeout
+        barrier = threading.Barrier(total, timeout=5)
+        
+        def create(model, messages):
+            response = Mock()
+            response.choices = [Mock()]
+            match = re.search(r"part (\d+) of", messages[0]['content'])
+            if match:
+                part = int(match.group(1))
+                barrier.wait()
+                response.choices[0].message.content = f"Summary {part}"
+            else:
+                response.choices[0].message.content = messages[1]['content']
+            return response
+        
+        generator.client.chat.completions.create.side_effect = create
+        
+        result = generator.generate(long_transcript)
+        
+        expected = "\n\n".join(f"Summary {i}" for i in range(1, total + 1))
+        assert result.endswith(expected)
+    
     def test_split_transcript(self, generator):
         """Test transcript splitting logic"""
         # Test short transcript (no split)
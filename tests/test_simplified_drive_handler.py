@@ -2,15 +2,36 @@
 
 import pytest
 from unittest.mock import Mock, patch, MagicMock
-from pathlib import Path
-import io
 
 from dnd_notetaker.simplified_drive_handler import SimplifiedDriveHandler
 
 
+def _set_files_response(mock_service, files_list):
+    """Make files().list().execute() return files_list
+    
+    Sets the return value through return_value attributes rather than by
+    calling the chain, which would record throwaway calls on the mock.
+    """
+    mock_service.files.return_value.list.return_value.execute.return_value = files_list
+
+
 class TestSimplifiedDriveHandler:
     """Test Google Drive download functionality"""
     
+    @pytest.fixture
+    def mock_build(self, monkeypatch):
+        """Replace the Drive API client factory"""
+        mock = MagicMock()
+        monkeypatch.setattr('dnd_notetaker.simplified_drive_handler.build', mock)
+        return mock
+    
+    @pytest.fixture
+    def mock_sa(self, monkeypatch):
+        """Replace service-account credential loading"""
+        mock = MagicMock()
+        monkeypatch.setattr('dnd_notetaker.simplified_drive_handler.service_account', mock)
+        return mock
+    
     @pytest.fixture
     def mock_service_account_file(self, tmp_path):
         """Create a mock service account file"""
@@ -18,8 +39,6 @@ class TestSimplifiedDriveHandler:
         sa_file.write_text('{"type": "service_account"}')
         return sa_file
     
-    @patch('dnd_notetaker.simplified_drive_handler.build')
-    @patch('dnd_notetaker.simplified_drive_handler.service_account')
     def test_init(self, mock_sa, mock_build, mock_service_account_file):
         """Test drive handler initialization"""
         # Mock credentials
@@ -39,8 +58,6 @@ class TestSimplifiedDriveHandler:
         mock_build.assert_called_once_with('drive', 'v3', credentials=mock_creds)
     
     @pytest.mark.skip(reason="Complex Google API mocking - covered by integration tests")
-    @patch('dnd_notetaker.simplified_drive_handler.build')
-    @patch('dnd_notetaker.simplified_drive_handler.service_account')
     def test_download_file_success(self, mock_sa, mock_build, mock_service_account_file, tmp_path):
         """Test successful file download"""
         # Mock credentials
@@ -97,8 +114,6 @@ class TestSimplifiedDriveHandler:
             assert expected_path.exists()
             assert expected_path.read_bytes() == file_content
     
-    @patch('dnd_notetaker.simplified_drive_handler.build')
-    @patch('dnd_notetaker.simplified_drive_handler.service_account')
     def test_download_file_not_video(self, mock_sa, mock_build, mock_service_account_file, tmp_path):
         """Test error when file is not a video"""
         # Mock credentials
@@ -126,8 +141,6 @@ class TestSimplifiedDriveHandler:
         with pytest.raises(RuntimeError, match="Download failed: File is not a video"):
             handler.download_file("file123", tmp_path)
     
-    @patch('dnd_notetaker.simplified_drive_handler.build')
-    @patch('dnd_notetaker.simplified_drive_handler.service_account')
     def test_download_most_recent_success(self, mock_sa, mock_build, mock_service_account_file, tmp_path):
         """Test downloading the most recent recording"""
         # Mock credentials
@@ -161,7 +174,7 @@ class TestSimplifiedDriveHandler:
                 }
             ]
         }
-        mock_service.files().list().execute.return_value = files_list
+        _set_files_response(mock_service, files_list)
         
         # Create handler
         handler = SimplifiedDriveHandler(mock_service_account_file)
@@ -173,11 +186,12 @@ class TestSimplifiedDriveHandler:
             # Download most recent
             result = handler.download_most_recent(tmp_path)
             
-            # Verify it downloaded the first video file (most recent)
-            mock_download.assert_called_once_with('file1', tmp_path)
+            # Verify it downloaded the first video file (most recent),
+            # passing its listing metadata along
+            mock_download.assert_called_once_with(
+                'file1', tmp_path, files_list['files'][0]
+            )
     
-    @patch('dnd_notetaker.simplified_drive_handler.build')
-    @patch('dnd_notetaker.simplified_drive_handler.service_account')
     def test_download_most_recent_no_videos(self, mock_sa, mock_build, mock_service_account_file, tmp_path):
         """Test error when no recordings are found"""
         # Mock credentials
@@ -189,7 +203,7 @@ class TestSimplifiedDriveHandler:
         mock_build.return_value = mock_service
         
         # Mock empty file list
-        mock_service.files().list().execute.return_value = {'files': []}
+        _set_files_response(mock_service, {'files': []})
         
         # Create handler and try to download
         mock_config = Mock()
@@ -200,8 +214,6 @@ class TestSimplifiedDriveHandler:
         with pytest.raises(RuntimeError, match="Failed to find recent recording: No Meet recordings found in Drive"):
             handler.download_most_recent(tmp_path)
     
-    @patch('dnd_notetaker.simplified_drive_handler.build')
-    @patch('dnd_notetaker.simplified_drive_handler.service_account')
     def test_download_most_recent_fallback(self, mock_sa, mock_build, mock_service_account_file, tmp_path):
         """Test fallback when no video mime type but Meet in name"""
         # Mock credentials
@@ -223,7 +235,7 @@ class TestSimplifiedDriveHandler:
                 }
             ]
         }
-        mock_service.files().list().execute.return_value = files_list
+        _set_files_response(mock_service, files_list)
         
         # Create handler
         handler = SimplifiedDriveHandler(mock_service_account_file)
@@ -236,11 +248,41 @@ class TestSimplifiedDriveHandler:
             result = handler.download_most_recent(tmp_path)
             
             # Verify it downloaded the file (fallback)
-            mock_download.assert_called_once_with('file1', tmp_path)
+            mock_download.assert_called_once_with(
+                'file1', tmp_path, files_list['files'][0]
+            )
+    
+    @patch('dnd_notetaker.simplified_drive_handler.MediaIoBaseDownload')
+    def test_download_file_with_known_metadata(self, mock_downloader_class, mock_sa, mock_build,
+                                               mock_service_account_file, tmp_path):
+        """Test that passing listing metadata skips the metadata request"""
+        mock_service = Mock()
+        mock_build.return_value = mock_service
+        mock_downloader_class.return_value.next_chunk.return_value = (None, True)
+        
+        handler = SimplifiedDriveHandler(mock_service_account_file, Mock(dry_run=False))
+        file_metadata = {
+            'id': 'file1',
+            'name': 'Meet Recording.mp4',
+            'size': '1024',
+            'mimeType': 'video/mp4'
+        }
+        
+        result = handler.download_file('file1', tmp_path, file_metadata)
+        
+        assert result == tmp_path / 'Meet Recording.mp4'
+        mock_service.files.return_value.get.assert_not_called()
+        mock_service.files.return_value.get_media.assert_called_once_with(fileId='file1')
     
-    @patch('dnd_notetaker.simplified_drive_handler.build')
-    @patch('dnd_notetaker.simplified_drive_handler.service_account')
-    def test_format_size(self, mock_sa, mock_build, mock_service_account_file):
+    @pytest.mark.parametrize("size,expected", [
+        (500, "500.0 B"),
+        (1024, "1.0 KB"),
+        (1536, "1.5 KB"),
+        (1048576, "1.0 MB"),
+        (1073741824, "1.0 GB"),
+        (1099511627776, "1.0 TB")
+    ])
+    def test_format_size(self, mock_sa, mock_build, mock_service_account_file, size, expected):
         """Test file size formatting"""
         # Mock credentials
         mock_creds = Mock()
@@ -248,17 +290,7 @@ class TestSimplifiedDriveHandler:
         
         handler = SimplifiedDriveHandler(mock_service_account_file)
         
-        test_cases = [
-            (500, "500.0 B"),
-            (1024, "1.0 KB"),
-            (1536, "1.5 KB"),
-            (1048576, "1.0 MB"),
-            (1073741824, "1.0 GB"),
-            (1099511627776, "1.0 TB")
-        ]
-        
-        for size, expected in test_cases:
-            assert handler._format_size(size) == expected
+        assert handler._format_size(size) == expected
     
     def test_dry_run_init(self, mock_service_account_file):
         """Test drive handler initialization in dry run mode"""
@@ -1,9 +1,6 @@
 import logging
 import os
-import shutil
-import tempfile
-from datetime import datetime
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 
@@ -31,11 +28,9 @@ class TestSetupLogging:
 
 
 class TestSaveTextOutput:
-    def setup_method(self):
-        self.temp_dir = tempfile.mkdtemp()
-
-    def teardown_method(self):
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    @pytest.fixture(autouse=True)
+    def setup(self, temp_dir):
+        self.temp_dir = temp_dir
 
     def test_save_text_output_creates_file(self):
         content = "Test content"